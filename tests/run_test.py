@@ -1788,6 +1788,102 @@ def privleapd_send_corrupted_control_message_test(bogus: str) -> bool:
     return True
 
 
+def privleapd_stall_control_message_test(bogus: str) -> bool:
+    """
+    Test how privleapd handles a control client that sends part of a message
+      header and then stops sending data without disconnecting. Other control
+      clients must still be served while the stalled client is connected.
+    """
+
+    if bogus != "":
+        return False
+    util.discard_privleapd_stderr()
+    assert_success: bool = True
+    stall_session: pl.PrivleapSession = pl.PrivleapSession(
+        is_control_session=True
+    )
+    assert stall_session.backend_socket is not None
+    util.socket_send_raw_bytes(stall_session.backend_socket, b"\x00\x00")
+    # Before privleapd read control sessions without blocking, it would wait
+    # up to a full base_delay for the stalled client before serving anyone
+    # else. Require the reply to come back in half that time.
+    start_time: float = time.monotonic()
+    control_session: pl.PrivleapSession = pl.PrivleapSession(
+        is_control_session=True
+    )
+    control_session.send_msg(
+        pl.PrivleapControlClientCreateMsg(PlTestGlobal.test_username)
+    )
+    control_server_msg: pl.PrivleapMsg = control_session.get_msg()
+    reply_time: float = time.monotonic() - start_time
+    control_session.close_session()
+    if not isinstance(control_server_msg, pl.PrivleapControlServerExistsMsg):
+        logging.error(
+            "privleapd returned unexpected message type: %s",
+            type(control_server_msg),
+        )
+        assert_success = False
+    if reply_time >= PlTestGlobal.base_delay / 2:
+        logging.error(
+            "privleapd took %.3f seconds to reply while another control "
+            "client was stalled",
+            reply_time,
+        )
+        assert_success = False
+    # privleapd gives control clients half a second to send a whole message,
+    # wait for that to run out before looking for the error.
+    time.sleep(PlTestGlobal.base_delay * 10)
+    if not util.compare_privleapd_stderr(
+        PlTestData.stall_control_message_lines
+    ):
+        assert_success = False
+    stall_session.close_session()
+    return assert_success
+
+
+def privleapd_split_create_user_socket_test(bogus: str) -> bool:
+    """
+    Test how privleapd handles a control client that sends a valid CREATE
+      message in two pieces, with a delay in between.
+    """
+
+    if bogus != "":
+        return False
+    util.discard_privleapd_stderr()
+    assert_success: bool = True
+    control_session: pl.PrivleapSession = pl.PrivleapSession(
+        is_control_session=True
+    )
+    assert control_session.backend_socket is not None
+    create_msg_bytes: bytes = pl.PrivleapControlClientCreateMsg(
+        PlTestGlobal.test_username
+    ).serialize()
+    create_msg_packet: bytes = (
+        len(create_msg_bytes).to_bytes(4, byteorder="big") + create_msg_bytes
+    )
+    # Split the message in the middle of the length header.
+    util.socket_send_raw_bytes(
+        control_session.backend_socket, create_msg_packet[:2]
+    )
+    time.sleep(PlTestGlobal.base_delay)
+    util.socket_send_raw_bytes(
+        control_session.backend_socket, create_msg_packet[2:]
+    )
+    control_server_msg: pl.PrivleapMsg = control_session.get_msg()
+    control_session.close_session()
+    if not isinstance(control_server_msg, pl.PrivleapControlServerExistsMsg):
+        logging.error(
+            "privleapd returned unexpected message type: %s",
+            type(control_server_msg),
+        )
+        assert_success = False
+    if not util.compare_privleapd_stderr(
+        PlTestData.split_create_user_socket_lines
+    ):
+        assert_success = False
+    return assert_success
+
+
 def privleapd_bail_comm_test(bogus: str) -> bool:
     """
     Test how privleapd handles a comm client that immediately disconnects after
@@ -2677,6 +2773,17 @@ def run_privleapd_tests() -> None:
         exit_code=0,
         stdout_data=PlTestData.test_username_socket_created,
     )
+    privleapd_assert_function(
+        privleapd_stall_control_message_test,
+        "",
+        "Test privleapd against a stalled control message",
+    )
+    privleapd_assert_function(
+        privleapd_split_create_user_socket_test,
+        "",
+        "Test privleapd socket create request sent in two pieces",
+    )
+    # ---
     privleapd_assert_function(
         privleapd_bail_comm_test,
         "",
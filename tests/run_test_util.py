@@ -21,12 +21,14 @@ import logging
 import pwd
 import grp
 import shutil
+import stat
 import time
 import socket
+import select
+import selectors
 import fcntl
 from pathlib import Path
 from typing import Tuple, IO, Callable
-from datetime import datetime, timedelta
 
 
 class PlTestGlobal:
@@ -34,19 +36,19 @@ class PlTestGlobal:
     Global variables for privleap tests.
     """
 
-    linebuf: str = ""
+    stdout_linebuf: bytearray = bytearray()
+    stderr_linebuf: bytearray = bytearray()
+    privleapd_selector: selectors.BaseSelector | None = None
     privleap_conf_base_dir: Path = Path("/etc/privleap")
-    privleap_conf_dir: Path = Path(f"{privleap_conf_base_dir}/conf.d")
-    privleap_conf_backup_dir: Path = Path(
-        f"{privleap_conf_base_dir}/conf.d.bak"
-    )
-    privleapd_proc: subprocess.Popen[str] | None = None
+    privleap_conf_dir: Path = privleap_conf_base_dir / "conf.d"
+    privleap_conf_backup_dir: Path = privleap_conf_base_dir / "conf.d.bak"
+    privleapd_proc: subprocess.Popen[bytes] | None = None
     privleapd_test_ready_file: Path = Path("/tmp/privleapd-ready-for-test")
     test_username: str = "privleaptest"
     test_username_bytes: bytes = test_username.encode("utf-8")
-    test_home_dir: Path = Path(f"/home/{test_username}")
+    test_home_dir: Path = Path("/home") / test_username
     privleap_state_dir: Path = Path("/run/privleapd")
-    privleap_state_comm_dir: Path = Path(privleap_state_dir, "comm")
+    privleap_state_comm_dir: Path = privleap_state_dir / "comm"
     base_delay: float = 0.1
     privleapd_running: bool = False
     no_service_handling = False
@@ -56,51 +58,79 @@ class PlTestGlobal:
 SelectInfo = Tuple[list[IO[bytes]], list[IO[bytes]], list[IO[bytes]]]
 
 
+def pop_linebuf_line(linebuf: bytearray, newline_idx: int) -> str:
+    """
+    Removes the line ending at newline_idx from the start of a line buffer,
+      and returns it as a string.
+    """
+
+    line_bytes: bytes = bytes(linebuf[: newline_idx + 1])
+    del linebuf[: newline_idx + 1]
+    return line_bytes.decode("utf-8", "replace")
+
+
 def proc_try_readline(
-    proc: subprocess.Popen[str], timeout: float, read_stderr: bool = False
+    proc: subprocess.Popen[bytes], timeout: float, read_stderr: bool = False
 ) -> str | None:
     """
     Reads a line of test from the stdout or stderr of a process. Allows
-      specifying a timeout for bailing out early. The stdout (or stderr)
-      of the process must be in non-blocking mode.
+      specifying a timeout for bailing out early. The stdout and stderr of the
+      process must be in non-blocking mode and registered with
+      PlTestGlobal.privleapd_selector.
     """
 
     assert proc.stdout is not None
     assert proc.stderr is not None
+    assert PlTestGlobal.privleapd_selector is not None
 
-    # If there's a line already in the buffer, find and return it.
-    if "\n" in PlTestGlobal.linebuf:
-        linebuf_parts: list[str] = PlTestGlobal.linebuf.split("\n", maxsplit=1)
-        PlTestGlobal.linebuf = linebuf_parts[1]
-        return linebuf_parts[0] + "\n"
-
-    # Select the correct stream to read from.
+    # Select the correct stream and buffer to read from.
     if read_stderr:
-        target_stream: IO[str] = proc.stderr
+        target_fd: int = proc.stderr.fileno()
+        target_linebuf: bytearray = PlTestGlobal.stderr_linebuf
     else:
-        target_stream = proc.stdout
-
-    # Attempt to read from the stream, adding whatever is available from the
-    # stream into a buffer.
-    current_time: datetime = datetime.now()
-    end_time = current_time + timedelta(seconds=timeout)
+        target_fd = proc.stdout.fileno()
+        target_linebuf = PlTestGlobal.stdout_linebuf
+
+    # If there's a line already in the buffer, return it right away.
+    newline_idx: int = target_linebuf.find(b"\n")
+    if newline_idx != -1:
+        return pop_linebuf_line(target_linebuf, newline_idx)
+
+    # Wait for either stream to become readable, then add whatever is
+    # available from it into its buffer. Both streams are drained even though
+    # only one is wanted, so that the process can never block on a full pipe
+    # we aren't reading from. We read from the underlying fds directly,
+    # bypassing Python's buffered IO, so that the whole backlog can be pulled
+    # in with as few syscalls as possible.
+    end_time: float = time.monotonic() + timeout
     while True:
-        try:
-            PlTestGlobal.linebuf += target_stream.read()
-        except Exception:
-            pass
-        if "\n" in PlTestGlobal.linebuf:
+        remaining_time: float = end_time - time.monotonic()
+        ready_list: list[tuple[selectors.SelectorKey, int]] = (
+            PlTestGlobal.privleapd_selector.select(max(remaining_time, 0))
+        )
+        if len(ready_list) == 0:
             break
-        current_time = datetime.now()
-        if current_time >= end_time:
+        # The buffer had no newline in it before this read, so only the newly
+        # read data needs to be searched.
+        search_start: int = len(target_linebuf)
+        target_eof: bool = False
+        for ready_key, _ in ready_list:
+            try:
+                stream_data: bytes = os.read(ready_key.fd, 65536)
+            except BlockingIOError:
+                continue
+            if stream_data == b"":
+                # EOF, nothing more will ever arrive on this stream.
+                PlTestGlobal.privleapd_selector.unregister(ready_key.fd)
+                if ready_key.fd == target_fd:
+                    target_eof = True
+                continue
+            ready_key.data.extend(stream_data)
+        newline_idx = target_linebuf.find(b"\n", search_start)
+        if newline_idx != -1:
+            return pop_linebuf_line(target_linebuf, newline_idx)
+        if target_eof or remaining_time <= 0:
             break
-        time.sleep(0.0001)
-
-    # Retrieve a line from the buffer and return it.
-    linebuf_parts = PlTestGlobal.linebuf.split("\n", maxsplit=1)
-    if len(linebuf_parts) == 2:
-        PlTestGlobal.linebuf = linebuf_parts[1]
-        return linebuf_parts[0] + "\n"
 
     # If there was no line to retrieve, return None.
     return None
@@ -123,17 +153,19 @@ def ensure_path_lacks_files(path: Path) -> None:
       directories.
     """
 
-    if path.exists() and not path.is_dir():
-        logging.critical(
-            "Path '%s' contains a non-dir at '%s'!", str(path), str(path)
-        )
-        sys.exit(1)
-    for parent_path in path.parents:
-        if parent_path.exists() and not parent_path.is_dir():
+    # Walk from the top of the path downwards, stat()ing each component only
+    # once. Once a component is found to be missing, nothing below it can
+    # exist either, so we can stop there.
+    for sub_path in (*reversed(path.parents), path):
+        try:
+            sub_path_stat: os.stat_result = os.stat(sub_path)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISDIR(sub_path_stat.st_mode):
             logging.critical(
                 "Path '%s' contains a non-dir at '%s'!",
                 str(path),
-                str(parent_path),
+                str(sub_path),
             )
             sys.exit(1)
 
@@ -144,22 +176,25 @@ def setup_test_account(test_username: str, test_home_dir: Path) -> None:
       configured.
     """
 
-    user_name_list: list[str] = [p.pw_name for p in pwd.getpwall()]
-    if test_username not in user_name_list:
+    # Look up the account directly rather than enumerating the entire user
+    # database, which can be very slow on systems using network-backed NSS.
+    try:
+        user_info: pwd.struct_passwd = pwd.getpwnam(test_username)
+    except KeyError:
         try:
             subprocess.run(["useradd", "-m", test_username], check=True)
+            user_info = pwd.getpwnam(test_username)
         except Exception as e:
             logging.critical(
                 "Could not create account '%s'!", test_username, exc_info=e
             )
             sys.exit(1)
-    user_gid: int = pwd.getpwnam(test_username).pw_gid
-    group_list: list[str] = [
+    group_set: set[str] = {
         grp.getgrgid(gid).gr_name
-        for gid in os.getgrouplist(test_username, user_gid)
-    ]
+        for gid in os.getgrouplist(test_username, user_info.pw_gid)
+    }
     for additional_group in ("sudo", "privleap"):
-        if not additional_group in group_list:
+        if not additional_group in group_set:
             try:
                 subprocess.run(
                     ["adduser", test_username, additional_group],
@@ -257,7 +292,6 @@ def start_privleapd_subprocess(
             full_args,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            encoding="utf-8",
         )
     except Exception as e:
         logging.critical("Could not start privleapd server!", exc_info=e)
@@ -274,6 +308,19 @@ def start_privleapd_subprocess(
         fcntl.F_SETFL,
         os.O_NONBLOCK,
     )
+    PlTestGlobal.stdout_linebuf = bytearray()
+    PlTestGlobal.stderr_linebuf = bytearray()
+    PlTestGlobal.privleapd_selector = selectors.DefaultSelector()
+    PlTestGlobal.privleapd_selector.register(
+        PlTestGlobal.privleapd_proc.stdout.fileno(),
+        selectors.EVENT_READ,
+        PlTestGlobal.stdout_linebuf,
+    )
+    PlTestGlobal.privleapd_selector.register(
+        PlTestGlobal.privleapd_proc.stderr.fileno(),
+        selectors.EVENT_READ,
+        PlTestGlobal.stderr_linebuf,
+    )
     if allow_error_output:
         time.sleep(PlTestGlobal.base_delay * 2)
     else:
@@ -315,6 +362,9 @@ def stop_privleapd_subprocess() -> None:
     """
 
     assert PlTestGlobal.privleapd_proc is not None
+    if PlTestGlobal.privleapd_selector is not None:
+        PlTestGlobal.privleapd_selector.close()
+        PlTestGlobal.privleapd_selector = None
     try:
         PlTestGlobal.privleapd_proc.kill()
         _ = PlTestGlobal.privleapd_proc.communicate()
@@ -336,13 +386,22 @@ def assert_command_result(
       expected values.
     """
 
+    # Each command gets its own freshly spawned process rather than being
+    # batched through a shared shell, since the tests depend on every command
+    # having its own exit code, environment, and separate stdout and stderr
+    # streams. No preexec_fn is passed, which allows subprocess to spawn the
+    # child with vfork() rather than a full fork().
     test_result: subprocess.CompletedProcess[bytes] = subprocess.run(
         command_data, check=False, capture_output=True
     )
-    logging.info("Ran command: %s", command_data)
-    logging.info("Exit code: %s", test_result.returncode)
-    logging.info("Stdout: %s", test_result.stdout)
-    logging.info("Stderr: %s", test_result.stderr)
+    # Check the log level once up front, rather than going through the
+    # logging machinery for every line of output when INFO is disabled.
+    log_info: bool = logging.getLogger().isEnabledFor(logging.INFO)
+    if log_info:
+        logging.info("Ran command: %s", command_data)
+        logging.info("Exit code: %s", test_result.returncode)
+        logging.info("Stdout: %s", test_result.stdout)
+        logging.info("Stderr: %s", test_result.stderr)
     assert_failed: bool = False
     if filter_func is None:
         stdout_result = test_result.stdout
@@ -350,8 +409,9 @@ def assert_command_result(
     else:
         stdout_result = filter_func(test_result.stdout, True)
         stderr_result = filter_func(test_result.stderr, False)
-        logging.info("Filtered stdout: %s", stdout_result)
-        logging.info("Filtered stderr: %s", stderr_result)
+        if log_info:
+            logging.info("Filtered stdout: %s", stdout_result)
+            logging.info("Filtered stderr: %s", stderr_result)
     if exit_code != test_result.returncode:
         logging.error("Exit code assert failed, expected: %s", exit_code)
         assert_failed = True
@@ -372,24 +432,15 @@ def write_privleap_test_config() -> None:
       empty file, and one file that contains only comments.
     """
 
-    with open(
-        Path(PlTestGlobal.privleap_conf_dir, "unit-test.conf"),
-        "w",
-        encoding="utf-8",
-    ) as config_file:
-        config_file.write(PlTestData.primary_test_config_file)
-    with open(
-        Path(PlTestGlobal.privleap_conf_dir, "comment-only.conf"),
-        "w",
-        encoding="utf-8",
-    ) as config_file:
-        config_file.write(PlTestData.comment_only_config_file)
-    with open(
-        Path(PlTestGlobal.privleap_conf_dir, "empty.conf"),
-        "w",
-        encoding="utf-8",
-    ) as config_file:
-        config_file.write("\n")
+    Path(PlTestGlobal.privleap_conf_dir, "unit-test.conf").write_bytes(
+        PlTestData.primary_test_config_bytes
+    )
+    Path(PlTestGlobal.privleap_conf_dir, "comment-only.conf").write_text(
+        PlTestData.comment_only_config_file, encoding="utf-8"
+    )
+    Path(PlTestGlobal.privleap_conf_dir, "empty.conf").write_text(
+        "\n", encoding="utf-8"
+    )
 
 
 def compare_privleapd_stderr(
@@ -404,27 +455,28 @@ def compare_privleapd_stderr(
     assert PlTestGlobal.privleapd_proc is not None
     result_good: bool = True
     read_lines: list[str] = []
-    for line in assert_line_list:
-        while True:
-            proc_line = proc_try_readline(
-                PlTestGlobal.privleapd_proc,
-                PlTestGlobal.base_delay,
-                read_stderr=True,
-            )
-            if proc_line is None:
-                result_good = False
-                break
-            read_lines.append(proc_line)
-            if proc_line != line:
-                continue
-            # If we get this far, line == proc_line
-            break
-    while True:
-        proc_line = proc_try_readline(
+    assert_line_idx: int = 0
+    # Walk through the output once, advancing through the expected lines as
+    # they are found. Only wait for more output while there are still
+    # expected lines left to find.
+    while assert_line_idx < len(assert_line_list):
+        proc_line: str | None = proc_try_readline(
             PlTestGlobal.privleapd_proc,
             PlTestGlobal.base_delay,
             read_stderr=True,
         )
+        if proc_line is None:
+            result_good = False
+            break
+        read_lines.append(proc_line)
+        if proc_line == assert_line_list[assert_line_idx]:
+            assert_line_idx += 1
+    # Collect any trailing output that is already available, without waiting
+    # for more to arrive.
+    while True:
+        proc_line = proc_try_readline(
+            PlTestGlobal.privleapd_proc, 0, read_stderr=True
+        )
         if proc_line is None:
             break
         read_lines.append(proc_line)
@@ -443,14 +495,22 @@ def discard_privleapd_stderr() -> None:
 
     if PlTestGlobal.privleapd_running:
         assert PlTestGlobal.privleapd_proc is not None
-        while True:
-            proc_line = proc_try_readline(
-                PlTestGlobal.privleapd_proc,
-                PlTestGlobal.base_delay,
-                read_stderr=True,
-            )
-            if proc_line is None:
+        assert PlTestGlobal.privleapd_proc.stderr is not None
+        # The contents are thrown away, so there's no need to split them into
+        # lines. Read in large chunks until privleapd has been quiet for
+        # base_delay, so that late output from the previous test isn't picked
+        # up by the next one.
+        stderr_fd: int = PlTestGlobal.privleapd_proc.stderr.fileno()
+        while (
+            len(select.select([stderr_fd], [], [], PlTestGlobal.base_delay)[0])
+            != 0
+        ):
+            try:
+                if os.read(stderr_fd, 65536) == b"":
+                    break
+            except BlockingIOError:
                 break
+        PlTestGlobal.stderr_linebuf.clear()
 
 
 def start_privleapd_service() -> None:
@@ -468,18 +528,14 @@ def start_privleapd_service() -> None:
         sys.exit(1)
 
 
-def socket_send_raw_bytes(sock: socket.socket, buf: bytes) -> bool:
+def socket_send_raw_bytes(sock: socket.socket, buf: bytes) -> None:
     """
-    Sends a buffer of bytes through a socket, coping with partial sends
-      properly.
+    Sends a buffer of bytes through a socket. Raises an exception if the
+      socket is closed before the whole buffer is sent.
     """
-    buf_sent: int = 0
-    while buf_sent < len(buf):
-        last_sent: int = sock.send(buf[buf_sent:])
-        if last_sent == 0:
-            return False
-        buf_sent += last_sent
-    return True
+    # socket.sendall() retries partial sends internally without slicing the
+    # buffer.
+    sock.sendall(buf)
 
 
 class PlTestData:
@@ -621,6 +677,7 @@ User=news
 [persistent-users]
 User=messagebus
 """
+    primary_test_config_bytes: bytes = primary_test_config_file.encode("utf-8")
     comment_only_config_file: str = """# this is a comment
 # and so is this
 """
@@ -685,9 +742,9 @@ AuthorizedUsers=root
 Command=echo 'test-act-missing-auth'
 """
     test_username_create_error: bytes = (
-        b"ERROR: privleapd encountered an error while creating a comm "
-        b"socket for account '" + PlTestGlobal.test_username_bytes + b"'!\n"
-    )
+        "ERROR: privleapd encountered an error while creating a comm "
+        f"socket for account '{PlTestGlobal.test_username}'!\n"
+    ).encode("utf-8")
     privleapd_invalid_response: bytes = (
         b"ERROR: privleapd didn't return a valid response!\n"
     )
@@ -700,25 +757,21 @@ Command=echo 'test-act-missing-auth'
     apt_socket_created: bytes = b"Comm socket created for account '_apt'.\n"
     apt_socket_destroyed: bytes = b"Comm socket destroyed for account '_apt'.\n"
     test_username_socket_created: bytes = (
-        b"Comm socket created for account '"
-        + PlTestGlobal.test_username_bytes
-        + b"'.\n"
-    )
+        "Comm socket created for account "
+        f"'{PlTestGlobal.test_username}'.\n"
+    ).encode("utf-8")
     test_username_socket_destroyed: bytes = (
-        b"Comm socket destroyed for account '"
-        + PlTestGlobal.test_username_bytes
-        + b"'.\n"
-    )
+        "Comm socket destroyed for account "
+        f"'{PlTestGlobal.test_username}'.\n"
+    ).encode("utf-8")
     test_username_socket_missing: bytes = (
-        b"Comm socket does not exist for account '"
-        + PlTestGlobal.test_username_bytes
-        + b"'.\n"
-    )
+        "Comm socket does not exist for account "
+        f"'{PlTestGlobal.test_username}'.\n"
+    ).encode("utf-8")
     test_username_socket_exists: bytes = (
-        b"Comm socket already exists for account '"
-        + PlTestGlobal.test_username_bytes
-        + b"'.\n"
-    )
+        "Comm socket already exists for account "
+        f"'{PlTestGlobal.test_username}'.\n"
+    ).encode("utf-8")
     privleapd_connection_failed: bytes = (
         b"ERROR: Could not connect to privleapd!\n"
     )
@@ -764,18 +817,18 @@ Command=echo 'test-act-missing-auth'
     )
     leapctl_help: bytes = (
         b"leapctl <--create|--destroy> <user>\n"
-        + b"leapctl --reload\n"
-        + b"\n"
-        + b"    --create : Specifies that leapctl should request a communication "
-        + b"socket to\n"
-        + b"               be created for the specified user account.\n"
-        + b"    --destroy : Specifies that leapctl should request a communication "
-        + b"socket\n"
-        + b"                to be destroyed for the specified user account.\n"
-        + b"    --reload : Instructs privleapd to reload configuration without "
-        + b"restarting.\n"
-        + b"    user : The username or UID of the user account to create or destroy a\n"
-        + b"           communication socket for.\n"
+        b"leapctl --reload\n"
+        b"\n"
+        b"    --create : Specifies that leapctl should request a communication "
+        b"socket to\n"
+        b"               be created for the specified user account.\n"
+        b"    --destroy : Specifies that leapctl should request a communication "
+        b"socket\n"
+        b"                to be destroyed for the specified user account.\n"
+        b"    --reload : Instructs privleapd to reload configuration without "
+        b"restarting.\n"
+        b"    user : The username or UID of the user account to create or destroy a\n"
+        b"           communication socket for.\n"
     )
     test_act_free_authorized: bytes = (
         b"You are authorized to run action 'test-act-free'.\n"
@@ -805,26 +858,18 @@ Command=echo 'test-act-missing-auth'
         b"'test-act-nonexistent'.\n"
     )
     test_act_target_user: bytes = (
-        b"uid=1002("
-        + PlTestGlobal.test_username_bytes
-        + b") gid=1002("
-        + PlTestGlobal.test_username_bytes
-        + b") groups=1002("
-        + PlTestGlobal.test_username_bytes
-        + b"),0(root)\n"
-    )
+        f"uid=1002({PlTestGlobal.test_username}) "
+        f"gid=1002({PlTestGlobal.test_username}) "
+        f"groups=1002({PlTestGlobal.test_username}),0(root)\n"
+    ).encode("utf-8")
     test_act_target_group: bytes = (
-        b"uid=0(root) gid=1002("
-        + PlTestGlobal.test_username_bytes
-        + b") groups=1002("
-        + PlTestGlobal.test_username_bytes
-        + b"),0(root)\n"
-    )
+        f"uid=0(root) gid=1002({PlTestGlobal.test_username}) "
+        f"groups=1002({PlTestGlobal.test_username}),0(root)\n"
+    ).encode("utf-8")
     test_act_target_user_and_group: bytes = (
-        b"uid=1002("
-        + PlTestGlobal.test_username_bytes
-        + b") gid=0(root) groups=0(root)\n"
-    )
+        f"uid=1002({PlTestGlobal.test_username}) gid=0(root) "
+        "groups=0(root)\n"
+    ).encode("utf-8")
     test_act_rootdata: bytes = (
         b"/root\n"
         b"uid=0(root) gid=0(root) groups=0(root)\n"
@@ -952,7 +997,7 @@ Command=echo 'test-act-missing-auth'
     ]
     privleapd_verify_not_running_twice_fail: bytes = (
         b"verify_not_running_twice: CRITICAL: Cannot run two "
-        + b"privleapd processes at the same time!\n"
+        b"privleapd processes at the same time!\n"
     )
     privleapd_ensure_running_as_root_fail: bytes = (
         b"ensure_running_as_root: CRITICAL: privleapd must run as root!\n"
@@ -977,6 +1022,17 @@ Command=echo 'test-act-missing-auth'
         "Traceback (most recent call last):\n",
         "ValueError: recv_buf contains data past the last string\n",
     ]
+    stall_control_message_lines: list[str] = [
+        "handle_control_create_msg: INFO: Handled CREATE message for account "
+        + f"'{PlTestGlobal.test_username}', socket already exists\n",
+        "handle_control_session: ERROR: Could not get message from control client!\n",
+        "Traceback (most recent call last):\n",
+        "ConnectionAbortedError: Connection locked up\n",
+    ]
+    split_create_user_socket_lines: list[str] = [
+        "handle_control_create_msg: INFO: Handled CREATE message for account "
+        + f"'{PlTestGlobal.test_username}', socket already exists\n",
+    ]
     bail_comm_lines: list[str] = [
         "get_client_initial_msg: ERROR: Could not get message from client run by account "
         + f"'{PlTestGlobal.test_username}'!\n",
@@ -1048,134 +1104,39 @@ Command=echo 'test-act-missing-auth'
         b"\x00\x00\x00\x0dSIGNAL PARAM1",
         b"\x00\x00\x00\x0eSIGNAL  PARAM1",
     ]
-    # TODO: Any good way to avoid all the repetition?
-    invalid_ascii_lines_list: list[list[str]] = [
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid message type 'TEST' for socket\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: Invalid byte found in ASCII string data\n",
-        ],
-        [
-            "auth_signal_request: WARNING: Action run request: Could not find "
-            + "action 'PARAM1' requested by account "
-            + f"'{PlTestGlobal.test_username}'\n"
-        ],
-        [
-            "get_client_initial_msg: ERROR: Could not get message from client "
-            + f"run by account '{PlTestGlobal.test_username}'!\n",
-            "Traceback (most recent call last):\n",
-            "ValueError: recv_buf contains data past the last string\n",
-        ],
+    invalid_ascii_lines: list[str] = [
+        "get_client_initial_msg: ERROR: Could not get message from client "
+        + f"run by account '{PlTestGlobal.test_username}'!\n",
+        "Traceback (most recent call last):\n",
+        "ValueError: Invalid byte found in ASCII string data\n",
     ]
+    # Each entry corresponds to the entry with the same index in
+    # invalid_ascii_list.
+    invalid_ascii_lines_list: list[list[str]] = (
+        [invalid_ascii_lines] * 9
+        + [
+            [
+                "get_client_initial_msg: ERROR: Could not get message from "
+                + f"client run by account '{PlTestGlobal.test_username}'!\n",
+                "Traceback (most recent call last):\n",
+                "ValueError: Invalid message type 'TEST' for socket\n",
+            ]
+        ]
+        + [invalid_ascii_lines] * 9
+        + [
+            [
+                "auth_signal_request: WARNING: Action run request: Could not "
+                + "find action 'PARAM1' requested by account "
+                + f"'{PlTestGlobal.test_username}'\n"
+            ],
+            [
+                "get_client_initial_msg: ERROR: Could not get message from "
+                + f"client run by account '{PlTestGlobal.test_username}'!\n",
+                "Traceback (most recent call last):\n",
+                "ValueError: recv_buf contains data past the last string\n",
+            ],
+        ]
+    )
     duplicate_actions_config_file_lines: list[str] = [
         "parse_config_file: ERROR: Error parsing config: "
         + "'/etc/privleap/conf.d/unit-test.conf:58:error:Duplicate action "
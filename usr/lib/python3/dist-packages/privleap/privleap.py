@@ -411,6 +411,7 @@ class PrivleapSession:
         self.is_control_session: bool = False
         self.is_server_side: bool = False
         self.is_session_open: bool = False
+        self.feed_buf: bytearray = bytearray()
 
         if isinstance(session_info, str) or session_info is None:
             if user_name is not None:
@@ -670,12 +671,6 @@ class PrivleapSession:
 
         return (output_list, blob)
 
-    # pylint: disable=too-many-return-statements, too-many-branches, too-many-statements
-    # Rationale:
-    #   too-many-return-statements, too-many-branches, too-many-statements: This
-    #     is essentially a dispatch function, it shouldn't be split for
-    #     readability's sake and it can't use less return statements or
-    #     branches.
     def get_msg(self) -> PrivleapMsg:
         """
         Gets a message from the backend socket and returns it as a PrivleapMsg
@@ -691,6 +686,57 @@ class PrivleapSession:
             recv_buf: bytes = self.__recv_msg_cautious()
         else:
             recv_buf = self.__recv_msg()
+        return self.__parse_msg(recv_buf)
+
+    def feed(self, data: bytes) -> PrivleapMsg | None:
+        """
+        Adds data read from the backend socket by the caller to the session's
+          receive buffer. Returns a PrivleapMsg object once a whole message
+          has been buffered, or None if more data is needed. This is an
+          alternative to get_msg() for callers that watch the backend socket
+          themselves and must never block waiting for a slow remote end.
+          Passing an empty bytes object indicates that the remote end closed
+          the connection.
+        """
+
+        if not self.is_session_open:
+            raise IOError("Session is closed.")
+
+        if data == b"":
+            raise ConnectionAbortedError("Connection unexpectedly closed")
+        self.feed_buf += data
+
+        header_len: int = 4
+        if len(self.feed_buf) < header_len:
+            return None
+        msg_len: int = int.from_bytes(
+            self.feed_buf[:header_len], byteorder="big"
+        )
+
+        if self.is_server_side:
+            if msg_len > 4096:
+                raise ValueError("Received message is too long")
+
+        if len(self.feed_buf) < header_len + msg_len:
+            return None
+        msg_end: int = header_len + msg_len
+        recv_buf: bytes = bytes(self.feed_buf[header_len:msg_end])
+        del self.feed_buf[:msg_end]
+        return self.__parse_msg(recv_buf)
+
+    # pylint: disable=too-many-return-statements, too-many-branches, too-many-statements
+    # Rationale:
+    #   too-many-return-statements, too-many-branches, too-many-statements: This
+    #     is essentially a dispatch function, it shouldn't be split for
+    #     readability's sake and it can't use less return statements or
+    #     branches.
+    def __parse_msg(self, recv_buf: bytes) -> PrivleapMsg:
+        """
+        Parses a received message and returns it as a PrivleapMsg object. You
+          should use get_msg() or feed() to get an actual PrivleapMsg object
+          back.
+        """
+
         msg_type_str: str = self.__get_msg_type_field(recv_buf)
 
         # Note, we parse the arguments of every single message type, even if the
@@ -839,15 +885,22 @@ class PrivleapSession:
 
         msg_bytes: bytes = msg_obj.serialize()
         msg_len_bytes: bytes = len(msg_bytes).to_bytes(4, byteorder="big")
-        msg_payload: bytes = msg_len_bytes + msg_bytes
-        msg_payload_sent: int = 0
-        while msg_payload_sent < len(msg_payload):
-            msg_sent: int = self.backend_socket.send(
-                msg_payload[msg_payload_sent:]
-            )
+        # Send the length header and the message body together with
+        # sendmsg(), rather than copying them into one buffer first. If only
+        # part of the data is sent, drop whatever was fully sent and slice the
+        # rest.
+        msg_buf_list: list[memoryview] = [
+            memoryview(msg_len_bytes),
+            memoryview(msg_bytes),
+        ]
+        while len(msg_buf_list) != 0:
+            msg_sent: int = self.backend_socket.sendmsg(msg_buf_list)
             if msg_sent == 0:
                 raise ConnectionAbortedError("Connection unexpectedly closed")
-            msg_payload_sent += msg_sent
+            while len(msg_buf_list) != 0 and msg_sent >= len(msg_buf_list[0]):
+                msg_sent -= len(msg_buf_list.pop(0))
+            if msg_sent != 0:
+                msg_buf_list[0] = msg_buf_list[0][msg_sent:]
 
     def send_msg(self, msg_obj: PrivleapMsg) -> None:
         """
@@ -1016,6 +1069,7 @@ class PrivleapAction:
         self.action_command: str | None = None
         self.auth_users: list[str] = []
         self.auth_groups: list[str] = []
+        self.auth_gids: set[int] = set()
         self.target_user: str | None = None
         self.target_group: str | None = None
 
@@ -1059,6 +1113,13 @@ class PrivleapAction:
                     # nonexistent groups.
                     continue
                 self.auth_groups.append(auth_group)
+                # Also remember the group's GID, so that privleapd can check
+                # group membership against the GIDs returned by
+                # os.getgrouplist() without looking up every group's name.
+                try:
+                    self.auth_gids.add(grp.getgrnam(auth_group).gr_gid)
+                except KeyError:
+                    continue
 
         if target_user is not None:
             orig_target_user: str = target_user
@@ -1103,6 +1164,8 @@ class PrivleapCommon:
     user_name_regex: re.Pattern[str] = re.compile(r"[a-z_][-a-z0-9_]*\$?\Z")
     uid_regex: re.Pattern[str] = re.compile(r"[0-9]+")
     signal_name_regex: re.Pattern[str] = re.compile(r"[-A-Za-z0-9_.]+\Z")
+    detect_comment_regex: re.Pattern[str] = re.compile(r"\s*#")
+    detect_header_regex: re.Pattern[str] = re.compile(r"\[.*]\Z")
 
     @staticmethod
     def validate_id(
@@ -1147,8 +1210,6 @@ class PrivleapCommon:
         expected_disallowed_user_output_list: list[str] = []
         current_section_type: PrivleapConfigSection = PrivleapConfigSection.NONE
         line_idx: int = 0
-        detect_comment_regex: re.Pattern[str] = re.compile(r"\s*#")
-        detect_header_regex: re.Pattern[str] = re.compile(r"\[.*]\Z")
         current_header_name: str | None = None
         current_action_name: str | None = None
         current_action_command: str | None = None
@@ -1164,10 +1225,10 @@ class PrivleapCommon:
                 if line == "":
                     continue
 
-                if detect_comment_regex.match(line):
+                if PrivleapCommon.detect_comment_regex.match(line):
                     continue
 
-                if detect_header_regex.match(line):
+                if PrivleapCommon.detect_header_regex.match(line):
                     if first_header_parsed:
                         if current_section_type == PrivleapConfigSection.ACTION:
                             assert current_header_name is not None
@@ -1464,18 +1525,28 @@ class PrivleapCommon:
           does exist.
         """
 
+        # Look up the one account we care about rather than walking the whole
+        # account database with getpwall(), which can be very slow if NSS is
+        # backed by a network directory.
+        user_info: pwd.struct_passwd
         if PrivleapCommon.validate_id(
             user_name, PrivleapValidateType.USER_GROUP_NAME
         ):
-            user_list: list[str] = [pw.pw_name for pw in pwd.getpwall()]
-            if user_name in user_list:
-                return user_name
-        elif PrivleapCommon.validate_id(
+            try:
+                pwd.getpwnam(user_name)
+            except KeyError:
+                return None
+            return user_name
+        if PrivleapCommon.validate_id(
             user_name, PrivleapValidateType.USER_GROUP_UID
         ):
-            uid_list: list[str] = [str(pw.pw_uid) for pw in pwd.getpwall()]
-            if user_name in uid_list:
-                return pwd.getpwuid(int(user_name)).pw_name
+            try:
+                user_info = pwd.getpwuid(int(user_name))
+            except (KeyError, ValueError, OverflowError):
+                return None
+            # Reject non-canonical forms like "0123" for UID 123.
+            if str(user_info.pw_uid) == user_name:
+                return user_info.pw_name
         return None
 
     @staticmethod
@@ -1486,16 +1557,23 @@ class PrivleapCommon:
           does exist.
         """
 
+        group_info: grp.struct_group
         if PrivleapCommon.validate_id(
             group_name, PrivleapValidateType.USER_GROUP_NAME
         ):
-            group_list: list[str] = [gr.gr_name for gr in grp.getgrall()]
-            if group_name in group_list:
-                return group_name
-        elif PrivleapCommon.validate_id(
+            try:
+                grp.getgrnam(group_name)
+            except KeyError:
+                return None
+            return group_name
+        if PrivleapCommon.validate_id(
             group_name, PrivleapValidateType.USER_GROUP_UID
         ):
-            gid_list: list[str] = [str(gr.gr_gid) for gr in grp.getgrall()]
-            if group_name in gid_list:
-                return grp.getgrgid(int(group_name)).gr_name
+            try:
+                group_info = grp.getgrgid(int(group_name))
+            except (KeyError, ValueError, OverflowError):
+                return None
+            # Reject non-canonical forms like "0123" for GID 123.
+            if str(group_info.gr_gid) == group_name:
+                return group_info.gr_name
         return None
@@ -12,9 +12,12 @@
 """privleapd.py - privleap background process."""
 
 import sys
+import errno
 import shutil
 import select
-from threading import Thread
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
 import os
 import pwd
 import grp
@@ -24,7 +27,7 @@ import logging
 import time
 from enum import Enum
 from pathlib import Path
-from typing import Tuple, cast, SupportsIndex, NoReturn, Any
+from typing import Tuple, Callable, NoReturn, Any
 
 import sdnotify  # type: ignore
 
@@ -44,16 +47,31 @@ class PrivleapdGlobal:
     """
 
     config_dir: Path = Path("/etc/privleap/conf.d")
-    action_list: list[pl.PrivleapAction] = []
+    action_map: dict[str, pl.PrivleapAction] = {}
     persistent_user_list: list[str] = []
     allowed_user_list: list[str] = []
     expected_disallowed_user_list: list[str] = []
-    socket_list: list[pl.PrivleapSocket] = []
+    sockets_by_user: dict[str, pl.PrivleapSocket] = {}
+    sockets_by_fd: dict[int, pl.PrivleapSocket] = {}
+    control_sessions_by_fd: dict[int, Tuple[pl.PrivleapSession, float]] = {}
+    control_session_timeout: float = 0.5
     pid_file_path: Path = Path(pl.PrivleapCommon.state_dir, "pid")
+    pid_validate_regex: re.Pattern[str] = re.compile(r"\d+\Z")
     test_mode = False
     check_config_mode = False
     debug_mode = False
     sdnotify_object: sdnotify.SystemdNotifier = sdnotify.SystemdNotifier()
+    epoll: select.epoll = select.epoll()
+    # The number of comm sessions that may be in progress at once. Both the
+    # worker pool and the slot count below must use this same value, since
+    # sessions are refused rather than queued once every slot is taken.
+    max_comm_sessions: int = 64
+    comm_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=max_comm_sessions, thread_name_prefix="privleapd-comm"
+    )
+    comm_session_slots: BoundedSemaphore = BoundedSemaphore(max_comm_sessions)
+    pw_cache: dict[str, Tuple[float, pwd.struct_passwd]] = {}
+    pw_cache_ttl: float = 5.0
 
 
 class PrivleapdAuthStatus(Enum):
@@ -66,6 +84,53 @@ class PrivleapdAuthStatus(Enum):
     UNAUTHORIZED = 3
 
 
+def track_socket(sock: pl.PrivleapSocket) -> None:
+    """
+    Adds a listening socket to the set of sockets watched by main_loop().
+    """
+
+    assert sock.backend_socket is not None
+    sock_fd: int = sock.backend_socket.fileno()
+    if sock.user_name is not None:
+        PrivleapdGlobal.sockets_by_user[sock.user_name] = sock
+    PrivleapdGlobal.sockets_by_fd[sock_fd] = sock
+    PrivleapdGlobal.epoll.register(sock_fd, select.EPOLLIN)
+
+
+def untrack_socket(sock: pl.PrivleapSocket) -> None:
+    """
+    Removes a listening socket from the set of sockets watched by
+      main_loop(). This must be done before the socket is closed.
+    """
+
+    assert sock.backend_socket is not None
+    if sock.user_name is not None:
+        del PrivleapdGlobal.sockets_by_user[sock.user_name]
+    sock_fd: int = sock.backend_socket.fileno()
+    PrivleapdGlobal.epoll.unregister(sock_fd)
+    del PrivleapdGlobal.sockets_by_fd[sock_fd]
+
+
+def cached_getpwnam(user_name: str) -> pwd.struct_passwd:
+    """
+    Wrapper around pwd.getpwnam() that remembers results for a few seconds, so
+      that a burst of actions from one account doesn't result in a burst of
+      account database lookups. Raises KeyError if the account doesn't exist,
+      just like pwd.getpwnam(). Failed lookups are not cached.
+    """
+
+    now: float = time.monotonic()
+    cache_entry: Tuple[float, pwd.struct_passwd] | None = (
+        PrivleapdGlobal.pw_cache.get(user_name)
+    )
+    if cache_entry is not None:
+        if now - cache_entry[0] < PrivleapdGlobal.pw_cache_ttl:
+            return cache_entry[1]
+    user_info: pwd.struct_passwd = pwd.getpwnam(user_name)
+    PrivleapdGlobal.pw_cache[user_name] = (now, user_info)
+    return user_info
+
+
 def send_msg_safe(session: pl.PrivleapSession, msg: pl.PrivleapMsg) -> bool:
     """
     Sends a message to the client, gracefully handling the situation where the
@@ -123,22 +188,20 @@ def handle_control_create_msg(
         )
         return
 
-    for sock in PrivleapdGlobal.socket_list:
-        if sock.user_name == user_name:
-            # User already has an open socket
-            logging.info(
-                "Handled CREATE message for account '%s', socket already "
-                "exists",
-                user_name,
-            )
-            send_msg_safe(control_session, pl.PrivleapControlServerExistsMsg())
-            return
+    if user_name in PrivleapdGlobal.sockets_by_user:
+        # User already has an open socket
+        logging.info(
+            "Handled CREATE message for account '%s', socket already exists",
+            user_name,
+        )
+        send_msg_safe(control_session, pl.PrivleapControlServerExistsMsg())
+        return
 
     try:
         comm_socket: pl.PrivleapSocket = pl.PrivleapSocket(
             pl.PrivleapSocketType.COMMUNICATION, user_name
         )
-        PrivleapdGlobal.socket_list.append(comm_socket)
+        track_socket(comm_socket)
         logging.info(
             "Handled CREATE message for account '%s', socket created", user_name
         )
@@ -169,7 +232,6 @@ def handle_control_destroy_msg(
     # We don't have to validate the username since the
     # PrivleapControlClientDestroyMsg constructor does this for us already.
     assert control_msg.user_name is not None
-    remove_sock_idx: int | None = None
 
     user_name: str | None = pl.PrivleapCommon.normalize_user_id(
         control_msg.user_name
@@ -187,44 +249,42 @@ def handle_control_destroy_msg(
         )
         return
 
-    for sock_idx, sock in enumerate(PrivleapdGlobal.socket_list):
-        if sock.user_name == user_name:
-            socket_path: Path = Path(pl.PrivleapCommon.comm_dir, user_name)
-            if socket_path.exists():
-                try:
-                    socket_path.unlink()
-                except Exception as e:
-                    # Probably just a TOCTOU issue, i.e. someone already
-                    # removed the socket. Most likely caused by the user
-                    # fiddling with things, no big deal.
-                    logging.error(
-                        "Handling DESTROY, failed to delete socket at '%s'!",
-                        str(socket_path),
-                        exc_info=e,
-                    )
-            else:
-                logging.warning(
-                    "Handling DESTROY, no socket to delete at '%s'",
-                    str(socket_path),
-                )
-            remove_sock_idx = sock_idx
-            break
-
-    if remove_sock_idx is not None:
-        PrivleapdGlobal.socket_list.pop(cast(SupportsIndex, remove_sock_idx))
+    remove_sock: pl.PrivleapSocket | None = (
+        PrivleapdGlobal.sockets_by_user.get(user_name)
+    )
+    if remove_sock is None:
         logging.info(
-            "Handled DESTROY message for account '%s', socket destroyed",
+            "Handled DESTROY message for account '%s', socket did not exist",
             user_name,
         )
-        send_msg_safe(control_session, pl.PrivleapControlServerOkMsg())
+        send_msg_safe(control_session, pl.PrivleapControlServerNouserMsg())
         return
 
-    # remove_sock_idx is None.
+    socket_path: Path = Path(pl.PrivleapCommon.comm_dir, user_name)
+    if socket_path.exists():
+        try:
+            socket_path.unlink()
+        except Exception as e:
+            # Probably just a TOCTOU issue, i.e. someone already removed the
+            # socket. Most likely caused by the user fiddling with things, no
+            # big deal.
+            logging.error(
+                "Handling DESTROY, failed to delete socket at '%s'!",
+                str(socket_path),
+                exc_info=e,
+            )
+    else:
+        logging.warning(
+            "Handling DESTROY, no socket to delete at '%s'",
+            str(socket_path),
+        )
+
+    untrack_socket(remove_sock)
     logging.info(
-        "Handled DESTROY message for account '%s', socket did not exist",
+        "Handled DESTROY message for account '%s', socket destroyed",
         user_name,
     )
-    send_msg_safe(control_session, pl.PrivleapControlServerNouserMsg())
+    send_msg_safe(control_session, pl.PrivleapControlServerOkMsg())
     return
 
 
@@ -243,9 +303,12 @@ def handle_control_reload_msg(control_session: pl.PrivleapSession) -> None:
         )
 
 
-def handle_control_session(control_socket: pl.PrivleapSocket) -> None:
+def accept_control_session(control_socket: pl.PrivleapSocket) -> None:
     """
-    Handles control socket connections, for creating or destroying comm sockets.
+    Accepts a connection on the control socket. The session is watched by
+      main_loop() alongside the listening sockets, and is handled by
+      handle_control_session() as its data arrives, so that a slow client
+      cannot hold up the main loop.
     """
 
     try:
@@ -256,21 +319,95 @@ def handle_control_session(control_socket: pl.PrivleapSocket) -> None:
         )
         return
 
+    assert control_session.backend_socket is not None
+    control_fd: int = control_session.backend_socket.fileno()
+    PrivleapdGlobal.control_sessions_by_fd[control_fd] = (
+        control_session,
+        time.monotonic() + PrivleapdGlobal.control_session_timeout,
+    )
+    PrivleapdGlobal.epoll.register(control_fd, select.EPOLLIN)
+
+
+def close_control_session(control_fd: int) -> None:
+    """
+    Stops watching a control session and closes it.
+    """
+
+    control_session: pl.PrivleapSession = (
+        PrivleapdGlobal.control_sessions_by_fd.pop(control_fd)[0]
+    )
+    PrivleapdGlobal.epoll.unregister(control_fd)
+    close_session_quietly(control_session)
+
+
+def close_session_quietly(session: pl.PrivleapSession) -> None:
+    """
+    Closes a session, ignoring any errors that occur while doing so.
+    """
+
+    try:
+        session.close_session()
+    except Exception:
+        # The client may already have hung up, nothing else to do.
+        pass
+
+
+def expire_control_sessions() -> None:
+    """
+    Closes all control sessions that have not delivered a message in time.
+    """
+
+    now: float = time.monotonic()
+    expired_fd_list: list[int] = [
+        control_fd
+        for control_fd, (_, control_deadline) in (
+            PrivleapdGlobal.control_sessions_by_fd.items()
+        )
+        if control_deadline <= now
+    ]
+    for control_fd in expired_fd_list:
+        handle_control_session(control_fd, expired=True)
+
+
+def handle_control_session(control_fd: int, expired: bool = False) -> None:
+    """
+    Handles control socket connections, for creating or destroying comm sockets.
+      This is called each time the session becomes readable, and once more if
+      the session expires before a whole message has arrived. The message is
+      acted upon once it has fully arrived.
+    """
+
+    control_session: pl.PrivleapSession = (
+        PrivleapdGlobal.control_sessions_by_fd[control_fd][0]
+    )
+    session_done: bool = True
+
     try:
         control_msg: (
             pl.PrivleapMsg
             | pl.PrivleapControlClientCreateMsg
             | pl.PrivleapControlClientDestroyMsg
+            | None
         )
 
         try:
-            control_msg = control_session.get_msg()
+            if expired:
+                raise ConnectionAbortedError("Connection locked up")
+            assert control_session.backend_socket is not None
+            control_msg = control_session.feed(
+                control_session.backend_socket.recv(4096)
+            )
         except Exception as e:
             logging.error(
                 "Could not get message from control client!", exc_info=e
             )
             return
 
+        if control_msg is None:
+            # Still waiting on the rest of the message.
+            session_done = False
+            return
+
         if isinstance(control_msg, pl.PrivleapControlClientCreateMsg):
             handle_control_create_msg(control_session, control_msg)
         elif isinstance(control_msg, pl.PrivleapControlClientDestroyMsg):
@@ -284,7 +421,8 @@ def handle_control_session(control_socket: pl.PrivleapSocket) -> None:
             sys.exit(2)
 
     finally:
-        control_session.close_session()
+        if session_done:
+            close_control_session(control_fd)
 
 
 def run_action(
@@ -329,7 +467,7 @@ def run_action(
         # Target user is set but group is unset, set the group to the target
         # user's default group.
         assert target_user is not None
-        target_user_info: pwd.struct_passwd = pwd.getpwnam(target_user)
+        target_user_info: pwd.struct_passwd = cached_getpwnam(target_user)
         target_user_gid = target_user_info.pw_gid
         target_group = grp.getgrgid(target_user_gid).gr_name
     elif target_user is None:
@@ -342,6 +480,12 @@ def run_action(
     assert target_user is not None
     assert target_group is not None
 
+    # The command is always run through bash, even if it looks like it could
+    # be exec'ed directly. privleap.conf.d(5) documents that the command is
+    # passed verbatim to "bash -c", so PATH lookup, error messages, and exit
+    # codes for bad commands all come from bash. This costs less than it might
+    # seem, since a non-interactive bash reads no startup files, and when
+    # given a single simple command it execs it in place rather than forking.
     action_process: subprocess.Popen[bytes] = subprocess.Popen(
         [
             "/usr/libexec/privleap/shim.py",
@@ -414,30 +558,31 @@ def lookup_desired_action(action_name: str) -> pl.PrivleapAction | None:
       None if the action cannot be found.
     """
 
-    for action in PrivleapdGlobal.action_list:
-        if action.action_name == action_name:
-            return action
-    return None
+    return PrivleapdGlobal.action_map.get(action_name)
 
 
 def authorize_user(
-    action: pl.PrivleapAction, raw_user_name: str
+    action: pl.PrivleapAction, user_name: str
 ) -> PrivleapdAuthStatus:
     """
     Ensures the user that requested an action to be run is authorized to run
       the requested action. Returns an enum value indicating if the user is
-      authorized, and if not, why.
+      authorized, and if not, why. user_name must be an account name, as
+      normalized when the comm session was set up, not a UID.
     """
 
     assert action.action_name is not None
-    assert raw_user_name is not None
+    assert user_name is not None
 
-    user_name: str | None = pl.PrivleapCommon.normalize_user_id(raw_user_name)
-    if user_name is None:
+    # The name was already normalized when the session was set up, so one
+    # cached lookup is enough to make sure the account still exists.
+    try:
+        user_info: pwd.struct_passwd = cached_getpwnam(user_name)
+    except KeyError:
         # User doesn't exist? This should never happen but you never know...
         return PrivleapdAuthStatus.USER_MISSING
 
-    if pwd.getpwnam(user_name).pw_uid == 0:
+    if user_info.pw_uid == 0:
         # Root account, automatically grant access to everything
         return PrivleapdAuthStatus.AUTHORIZED
 
@@ -454,15 +599,13 @@ def authorize_user(
     if len(action.auth_groups) != 0:
         # Action exists but has restrictions on what groups can run it.
         # We need to get the list of groups this user is a member of to
-        # determine whether they are authorized or not.
-        user_gid: int = pwd.getpwnam(user_name).pw_gid
-        group_list: list[str] = [
-            grp.getgrgid(gid).gr_name
-            for gid in os.getgrouplist(user_name, user_gid)
-        ]
-        for group in group_list:
-            if group in action.auth_groups:
-                return PrivleapdAuthStatus.AUTHORIZED
+        # determine whether they are authorized or not. The action's groups
+        # were already resolved to GIDs when the config was loaded, so the
+        # GIDs can be compared directly.
+        if not action.auth_gids.isdisjoint(
+            os.getgrouplist(user_name, user_info.pw_gid)
+        ):
+            return PrivleapdAuthStatus.AUTHORIZED
     else:
         no_auth_groups = True
 
@@ -512,6 +655,27 @@ def check_action_terminate(
     return False
 
 
+def send_action_output(
+    comm_session: pl.PrivleapSession,
+    is_stdout: bool,
+    output_chunk_list: list[bytes],
+) -> bool:
+    """
+    Sends chunks of an action's stdout or stderr to the client as a single
+      message. Returns False if the message could not be sent.
+    """
+
+    # Joining a single chunk returns that chunk as-is, so the common case of
+    # one read per message doesn't copy the data.
+    output_buf: bytes = b"".join(output_chunk_list)
+    output_msg: pl.PrivleapMsg
+    if is_stdout:
+        output_msg = pl.PrivleapCommServerResultStdoutMsg(output_buf)
+    else:
+        output_msg = pl.PrivleapCommServerResultStderrMsg(output_buf)
+    return send_msg_safe(comm_session, output_msg)
+
+
 def send_action_results(
     comm_session: pl.PrivleapSession,
     action_name: str,
@@ -526,54 +690,65 @@ def send_action_results(
     assert action_process.stderr is not None
     assert comm_session.backend_socket is not None
 
+    stdout_fd: int = action_process.stdout.fileno()
+    stderr_fd: int = action_process.stderr.fileno()
+    # The action's output pipes were set non-blocking by run_action(), so they
+    # can be registered edge-triggered and drained until EAGAIN on every
+    # wakeup. The comm socket stays level-triggered, since
+    # check_action_terminate() only reads one message from it at a time.
+    action_epoll: select.epoll = select.epoll()
     try:
-        stdout_done: bool = False
-        stderr_done: bool = False
-
-        while not stdout_done or not stderr_done:
-            select.select(
-                [
-                    action_process.stdout.fileno(),
-                    action_process.stderr.fileno(),
-                    comm_session.backend_socket.fileno(),
-                ],
-                [],
-                [],
-            )
-
-            while True:
-                if check_action_terminate(comm_session, action_name):
-                    return
-
-                stdout_buf: bytes | None = action_process.stdout.read(1024)
-                stderr_buf: bytes | None = action_process.stderr.read(1024)
-
-                if stdout_buf == b"":
-                    stdout_done = True
-                elif stdout_buf is not None:
-                    if not send_msg_safe(
-                        comm_session,
-                        pl.PrivleapCommServerResultStdoutMsg(stdout_buf),
-                    ):
-                        return
-
-                if stderr_buf == b"":
-                    stderr_done = True
-                elif stderr_buf is not None:
-                    if not send_msg_safe(
-                        comm_session,
-                        pl.PrivleapCommServerResultStderrMsg(stderr_buf),
+        action_epoll.register(stdout_fd, select.EPOLLIN | select.EPOLLET)
+        action_epoll.register(stderr_fd, select.EPOLLIN | select.EPOLLET)
+        action_epoll.register(
+            comm_session.backend_socket.fileno(), select.EPOLLIN
+        )
+        open_fd_set: set[int] = {stdout_fd, stderr_fd}
+
+        while len(open_fd_set) != 0:
+            ready_event_list: list[Tuple[int, int]] = action_epoll.poll()
+            if check_action_terminate(comm_session, action_name):
+                return
+
+            for ready_fd, _ in ready_event_list:
+                if ready_fd not in open_fd_set:
+                    continue
+                # Small reads are collected and sent as one message, rather
+                # than sending one message per read. Whatever has been
+                # collected is still sent as soon as the pipe runs dry, so
+                # output from slow actions isn't held back.
+                stream_chunk_list: list[bytes] = []
+                stream_chunk_len: int = 0
+                while True:
+                    try:
+                        stream_buf: bytes = os.read(ready_fd, 65536)
+                    except BlockingIOError:
+                        break
+                    if stream_buf == b"":
+                        action_epoll.unregister(ready_fd)
+                        open_fd_set.remove(ready_fd)
+                        break
+                    stream_chunk_list.append(stream_buf)
+                    stream_chunk_len += len(stream_buf)
+                    if stream_chunk_len >= 16384:
+                        if not send_action_output(
+                            comm_session,
+                            ready_fd == stdout_fd,
+                            stream_chunk_list,
+                        ):
+                            return
+                        stream_chunk_list = []
+                        stream_chunk_len = 0
+                if len(stream_chunk_list) != 0:
+                    if not send_action_output(
+                        comm_session, ready_fd == stdout_fd, stream_chunk_list
                     ):
                         return
 
-                if (stdout_buf is None or stdout_done) and (
-                    stderr_buf is None or stderr_done
-                ):
-                    break
-
         action_process.wait()
 
     finally:
+        action_epoll.close()
         action_process.stdout.close()
         action_process.stderr.close()
         action_process.terminate()
@@ -711,21 +886,11 @@ def handle_signal_message(
     )
 
 
-def handle_comm_session(comm_socket: pl.PrivleapSocket) -> None:
+def handle_comm_session(comm_session: pl.PrivleapSession) -> None:
     """
     Handles comm socket connections, for running actions.
     """
 
-    try:
-        comm_session: pl.PrivleapSession = comm_socket.get_session()
-    except Exception as e:
-        logging.error(
-            "Could not start comm session with client run by account '%s'!",
-            comm_socket.user_name,
-            exc_info=e,
-        )
-        return
-
     try:
         comm_msg: (
             pl.PrivleapCommClientSignalMsg
@@ -753,6 +918,95 @@ def handle_comm_session(comm_socket: pl.PrivleapSocket) -> None:
         comm_session.close_session()
 
 
+def dispatch_comm_session(comm_socket: pl.PrivleapSocket) -> None:
+    """
+    Accepts a connection on a comm socket and hands it off to a worker thread.
+      The connection is accepted here rather than in the worker, so that the
+      listening socket doesn't stay readable until the worker gets to it and
+      cause the connection to be dispatched again. The session itself is set
+      up by the worker, since that involves an account database lookup.
+    """
+
+    assert comm_socket.backend_socket is not None
+    assert comm_socket.user_name is not None
+    try:
+        # socket.accept returns a (socket, address) tuple, we only need the
+        # socket from this
+        session_socket: socket.socket = comm_socket.backend_socket.accept()[0]
+    except Exception as e:
+        logging.error(
+            "Could not start comm session with client run by account '%s'!",
+            comm_socket.user_name,
+            exc_info=e,
+        )
+        return
+
+    # Each worker is held for as long as the action it runs, so sessions are
+    # never queued behind busy workers. If every worker is in use, the session
+    # is refused immediately instead.
+    if not PrivleapdGlobal.comm_session_slots.acquire(blocking=False):
+        logging.warning(
+            "Too many comm sessions in progress, refusing session with client "
+            "run by account '%s'",
+            comm_socket.user_name,
+        )
+        # No user_name is passed here, so that refusing a session doesn't
+        # need an account database lookup either.
+        refused_session: pl.PrivleapSession = pl.PrivleapSession(
+            session_socket
+        )
+        send_msg_safe(refused_session, pl.PrivleapCommServerTriggerErrorMsg())
+        close_session_quietly(refused_session)
+        return
+
+    try:
+        PrivleapdGlobal.comm_executor.submit(
+            run_comm_session, session_socket, comm_socket.user_name
+        )
+    except Exception as e:
+        PrivleapdGlobal.comm_session_slots.release()
+        logging.error(
+            "Could not dispatch comm session with client run by account '%s'!",
+            comm_socket.user_name,
+            exc_info=e,
+        )
+        session_socket.close()
+
+
+def run_comm_session(session_socket: socket.socket, user_name: str) -> None:
+    """
+    Runs a comm session on a worker thread. Any exception that escapes
+      handle_comm_session() is logged here, since the thread pool would
+      otherwise keep it in a Future that is never looked at. The session's
+      worker slot is freed once the session is done.
+    """
+
+    try:
+        try:
+            comm_session: pl.PrivleapSession = pl.PrivleapSession(
+                session_socket, user_name=user_name, is_control_session=False
+            )
+        except Exception as e:
+            logging.error(
+                "Could not start comm session with client run by account "
+                "'%s'!",
+                user_name,
+                exc_info=e,
+            )
+            session_socket.close()
+            return
+
+        handle_comm_session(comm_session)
+    except Exception as e:
+        logging.error(
+            "Comm session with client run by account '%s' failed!",
+            user_name,
+            exc_info=e,
+        )
+    finally:
+        PrivleapdGlobal.comm_session_slots.release()
+
+
 def ensure_running_as_root() -> None:
     """
     Ensures the server is running as root. privleapd cannot function when
@@ -775,15 +1029,28 @@ def verify_not_running_twice() -> None:
 
     with open(PrivleapdGlobal.pid_file_path, "r", encoding="utf-8") as pid_file:
         old_pid_str: str = pid_file.read().strip()
-        old_pid_validate_regex: re.Pattern[str] = re.compile(r"\d+\Z")
-        if not old_pid_validate_regex.match(old_pid_str):
+        if not PrivleapdGlobal.pid_validate_regex.match(old_pid_str):
             return
 
         old_pid: int = int(old_pid_str)
-        # Send signal 0 to check for existence, this will raise an OSError if
-        # the process doesn't exist
+        # Open a pidfd for the old process to check for existence, this will
+        # raise an OSError if the process doesn't exist. If this Python build
+        # or the running kernel (older than 5.3) lacks pidfd_open(), fall back
+        # to sending signal 0, which raises an OSError in the same situation.
+        pidfd_open: Callable[[int], int] | None = getattr(
+            os, "pidfd_open", None
+        )
         try:
-            os.kill(old_pid, 0)
+            pidfd_supported: bool = pidfd_open is not None
+            if pidfd_open is not None:
+                try:
+                    os.close(pidfd_open(old_pid))
+                except OSError as e:
+                    if e.errno != errno.ENOSYS:
+                        raise
+                    pidfd_supported = False
+            if not pidfd_supported:
+                os.kill(old_pid, 0)
             # If no exception, the old privleapd process is still running.
             logging.critical(
                 "Cannot run two privleapd processes at the same time!"
@@ -836,25 +1103,26 @@ def append_if_not_in(item: Any, item_list: list[Any]) -> None:
         item_list.append(item)
 
 
-def extend_action_list(
-    action_arr: list[pl.PrivleapAction], target_arr: list[pl.PrivleapAction]
+def extend_action_map(
+    action_arr: list[pl.PrivleapAction],
+    target_map: dict[str, pl.PrivleapAction],
 ) -> str | None:
     """
-    Extend PrivleapdGlobal.action_list with the contents of action_arr. If a
+    Add the contents of action_arr to target_map, keyed by action name. If a
       duplicate action is found, stop early and return the name of the
       duplicate, otherwise return None.
     """
     for action_item in action_arr:
-        for existing_action_item in target_arr:
-            if action_item.action_name == existing_action_item.action_name:
-                return action_item.action_name
-        target_arr.append(action_item)
+        assert action_item.action_name is not None
+        if action_item.action_name in target_map:
+            return action_item.action_name
+        target_map[action_item.action_name] = action_item
     return None
 
 
 def parse_config_file(
     config_file: Path,
-    temp_action_list: list[pl.PrivleapAction],
+    temp_action_map: dict[str, pl.PrivleapAction],
     temp_persistent_user_list: list[str],
     temp_allowed_user_list: list[str],
     temp_expected_disallowed_user_list: list[str],
@@ -880,8 +1148,8 @@ def parse_config_file(
     persistent_user_arr = config_result[1]
     allowed_user_arr = config_result[2]
     expected_disallowed_user_arr = config_result[3]
-    duplicate_action_name: str | None = extend_action_list(
-        action_arr, temp_action_list
+    duplicate_action_name: str | None = extend_action_map(
+        action_arr, temp_action_map
     )
     if duplicate_action_name is not None:
         duplicate_action_error = pl.PrivleapCommon.find_bad_config_header(
@@ -914,13 +1182,16 @@ def parse_config_files() -> bool:
     """
 
     config_file_list: list[Path] = []
-    for config_file in PrivleapdGlobal.config_dir.iterdir():
-        if not config_file.is_file():
-            continue
-        config_file_list.append(config_file)
+    with os.scandir(PrivleapdGlobal.config_dir) as config_dir_iter:
+        for config_entry in config_dir_iter:
+            # DirEntry.is_file() can usually answer from the file type
+            # recorded in the directory listing, without a stat() call.
+            if not config_entry.is_file():
+                continue
+            config_file_list.append(Path(config_entry.path))
     config_file_list.sort()
 
-    temp_action_list: list[pl.PrivleapAction] = []
+    temp_action_map: dict[str, pl.PrivleapAction] = {}
     temp_persistent_user_list: list[str] = []
     temp_allowed_user_list: list[str] = []
     temp_expected_disallowed_user_list: list[str] = []
@@ -937,7 +1208,7 @@ def parse_config_files() -> bool:
         try:
             if not parse_config_file(
                 config_file,
-                temp_action_list,
+                temp_action_map,
                 temp_persistent_user_list,
                 temp_allowed_user_list,
                 temp_expected_disallowed_user_list,
@@ -948,7 +1219,7 @@ def parse_config_files() -> bool:
                 "Failed to load config file '%s'!", str(config_file), exc_info=e
             )
             return False
-    PrivleapdGlobal.action_list = temp_action_list
+    PrivleapdGlobal.action_map = temp_action_map
     PrivleapdGlobal.persistent_user_list = temp_persistent_user_list
     PrivleapdGlobal.allowed_user_list = temp_allowed_user_list
     PrivleapdGlobal.expected_disallowed_user_list = (
@@ -1015,7 +1286,7 @@ def open_control_socket() -> None:
         logging.critical("Failed to open control socket!", exc_info=e)
         sys.exit(1)
 
-    PrivleapdGlobal.socket_list.append(control_socket)
+    track_socket(control_socket)
 
 
 def open_persistent_comm_sockets() -> None:
@@ -1031,7 +1302,7 @@ def open_persistent_comm_sockets() -> None:
             comm_socket: pl.PrivleapSocket = pl.PrivleapSocket(
                 pl.PrivleapSocketType.COMMUNICATION, user_name
             )
-            PrivleapdGlobal.socket_list.append(comm_socket)
+            track_socket(comm_socket)
             # We intentionally don't log the creation of persistent user sockets
             # since for one, doing so would needlessly clutter the system logs
             # (the list of persistent users can be determined by just looking
@@ -1051,43 +1322,48 @@ def open_persistent_comm_sockets() -> None:
 def main_loop() -> NoReturn:
     """
     Main processing loop of privleapd. This loop will watch for and accept
-      connections as needed, spawning threads to handle each individual comm
-      connection. Control connections are handled in the main thread since they
-      aren't a DoS risk, and running two control sessions at once could be
-      dangerous.
+      connections as needed, passing each individual comm connection to a
+      bounded pool of worker threads. Control connections are handled in the
+      main thread since they aren't a DoS risk, and running two control
+      commands at once could be dangerous. Control sessions are read without
+      blocking as their data arrives, so a slow control client cannot stall
+      the loop.
     """
 
     while True:
-        ready_socket_list: Tuple[list[int], list[int], list[int]] = (
-            select.select(
-                [
-                    sock_obj.backend_socket.fileno()
-                    for sock_obj in PrivleapdGlobal.socket_list
-                    if sock_obj.backend_socket is not None
-                ],
-                [],
-                [],
-                5,
+        poll_timeout: float = 5
+        if len(PrivleapdGlobal.control_sessions_by_fd) != 0:
+            next_deadline: float = min(
+                control_deadline
+                for _, control_deadline in (
+                    PrivleapdGlobal.control_sessions_by_fd.values()
+                )
+            )
+            poll_timeout = min(
+                poll_timeout, max(next_deadline - time.monotonic(), 0)
             )
+        # The epoll object already knows which sockets to watch, so there's no
+        # need to hand it the full socket list on every iteration like select()
+        # needs, and only the sockets that are actually ready are returned.
+        ready_event_list: list[Tuple[int, int]] = PrivleapdGlobal.epoll.poll(
+            poll_timeout
         )
         PrivleapdGlobal.sdnotify_object.notify("WATCHDOG=1")
-        for ready_socket_fileno in ready_socket_list[0]:
-            ready_sock_obj: pl.PrivleapSocket | None = None
-            for sock_obj in PrivleapdGlobal.socket_list:
-                assert sock_obj.backend_socket is not None
-                if sock_obj.backend_socket.fileno() == ready_socket_fileno:
-                    ready_sock_obj = sock_obj
-                    break
+        for ready_socket_fileno, _ in ready_event_list:
+            if ready_socket_fileno in PrivleapdGlobal.control_sessions_by_fd:
+                handle_control_session(ready_socket_fileno)
+                continue
+            ready_sock_obj: pl.PrivleapSocket | None = (
+                PrivleapdGlobal.sockets_by_fd.get(ready_socket_fileno)
+            )
             if ready_sock_obj is None:
                 logging.critical("privleapd lost track of a socket!")
                 sys.exit(1)
             if ready_sock_obj.socket_type == pl.PrivleapSocketType.CONTROL:
-                handle_control_session(ready_sock_obj)
+                accept_control_session(ready_sock_obj)
             else:
-                comm_thread: Thread = Thread(
-                    target=handle_comm_session, args=[ready_sock_obj]
-                )
-                comm_thread.start()
+                dispatch_comm_session(ready_sock_obj)
+        expire_control_sessions()
 
 
 def print_usage() -> None:
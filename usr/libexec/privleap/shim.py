@@ -63,12 +63,13 @@ except Exception:
     sys.exit(255)
 pam_env_list: list[str] = pam_obj.getenvlist()
 
-action_env: dict[str, str] = os.environ.copy()
-action_env["HOME"] = target_user_info.pw_dir
-action_env["LOGNAME"] = target_user_info.pw_name
-action_env["SHELL"] = "/usr/bin/bash"
-action_env["PWD"] = target_user_info.pw_dir
-action_env["USER"] = target_user_info.pw_name
+action_env: dict[str, str] = os.environ | {
+    "HOME": target_user_info.pw_dir,
+    "LOGNAME": target_user_info.pw_name,
+    "SHELL": "/usr/bin/bash",
+    "PWD": target_user_info.pw_dir,
+    "USER": target_user_info.pw_name,
+}
 for env_var in pam_env_list:
     env_var_parts: list[str] = env_var.split("=", 1)
     action_env[env_var_parts[0]] = env_var_parts[1]